@@ -8,7 +8,8 @@ import time
 def main(argv: list[str] | None = None) -> int:
     p = argparse.ArgumentParser(
         description=(
-            "Matplotlib-native animated sine demo (two windows; line.set_ydata + plt.pause)."
+            "Matplotlib-native animated sine demo"
+            " (two windows; line.set_ydata + canvas.start_event_loop)."
         )
     )
     p.add_argument("--frames", type=int, default=200, help="Number of frames")
@@ -17,7 +18,7 @@ def main(argv: list[str] | None = None) -> int:
         "--pause",
         type=float,
         default=0.001,
-        help="plt.pause() dt (GUI event pumping)",
+        help="canvas.start_event_loop() dt (GUI event pumping; 0 only flushes events)",
     )
     p.add_argument(
         "--fps",
@@ -38,6 +39,7 @@ def main(argv: list[str] | None = None) -> int:
     matplotlib.rcParams["figure.raise_window"] = False
 
     import matplotlib.pyplot as plt
+    import numpy as np
 
     from matplotlib_window_tracker import (
         hold_windows,
@@ -46,11 +48,18 @@ def main(argv: list[str] | None = None) -> int:
     )
 
     n = max(args.n, 10)
-    xdata = [i / (n - 1) for i in range(n)]
-    omega_x = [2.0 * math.pi * xi for xi in xdata]
+    xdata = np.linspace(0.0, 1.0, n)
+    omega_x = 2.0 * np.pi * xdata
+    # The amplitude-modulated line only rescales this frame-invariant shape.
+    sin_omega_x = np.sin(omega_x)
+
+    # Per-frame y buffers handed to set_ydata(); ndarrays are taken as-is
+    # instead of being converted from Python lists on every frame.
+    y1 = np.zeros(n)
+    y2 = np.zeros(n)
 
     fig1, ax1 = plt.subplots(num="animated_sine: phase", clear=True, figsize=(8, 4))
-    (line1,) = ax1.plot(xdata, [0.0] * n)
+    (line1,) = ax1.plot(xdata, y1)
     ax1.set_ylim(-1.2, 1.2)
     ax1.grid(True, alpha=0.3)
     ax1.set_title("moving sine (phase)")
@@ -71,7 +80,7 @@ def main(argv: list[str] | None = None) -> int:
     )
 
     fig2, ax2 = plt.subplots(num="animated_sine: amplitude", clear=True, figsize=(8, 4))
-    (line2,) = ax2.plot(xdata, [0.0] * n, color="tab:orange")
+    (line2,) = ax2.plot(xdata, y2, color="tab:orange")
     ax2.set_ylim(-1.2, 1.2)
     ax2.grid(True, alpha=0.3)
     ax2.set_title("amplitude-modulated sine")
@@ -94,9 +103,10 @@ def main(argv: list[str] | None = None) -> int:
     # Ensure native windows are created before we query/apply window geometry.
     # In IPython (e.g. `%run`), managers can exist before the native windows are
     # fully realized.
+    # One show plus one event-loop run is enough; plt.pause() would re-enter
+    # plt.show() on every call.
     plt.show(block=False)
-    for _ in range(5):
-        plt.pause(0.01)
+    fig1.canvas.start_event_loop(0.05)
 
     # Showcase window geometry persistence (macOS-only): restore on startup (if cached)
     # and save new geometry when you finish moving/resizing.
@@ -191,24 +201,41 @@ def main(argv: list[str] | None = None) -> int:
     target_fps = float(args.fps)
     dt = 1.0 / target_fps if target_fps > 0 else 0.0
     t0 = time.perf_counter()
+    amp_title = ""
 
     for k in range(max(args.frames, 1)):
         phase = 0.15 * k
-        line1.set_ydata([math.sin(v + phase) for v in omega_x])
+        np.add(omega_x, phase, out=y1)
+        np.sin(y1, out=y1)
+        line1.set_ydata(y1)
 
         # Amplitude oscillates between -1 and 1.
         amp = math.sin(0.05 * k)
-        line2.set_ydata([amp * math.sin(v) for v in omega_x])
-        ax2.set_title(f"amplitude-modulated sine (amp={amp:+.2f})")
+        np.multiply(sin_omega_x, amp, out=y2)
+        line2.set_ydata(y2)
+        # The title shows amp to two decimals; near the extrema consecutive
+        # frames format identically, so skip relaying out unchanged text.
+        title = f"amplitude-modulated sine (amp={amp:+.2f})"
+        if title != amp_title:
+            amp_title = title
+            ax2.set_title(title)
 
         # Explicitly draw both canvases before pumping the event loop.
-        # plt.pause() only calls draw_idle() on the active figure, so with Qt
-        # the inactive window's paint event can be starved within the short
-        # pause interval.  Calling draw() synchronously on each canvas ensures
-        # both figures are rendered every frame regardless of focus.
+        # A deferred draw_idle() on the inactive window can be starved by Qt
+        # within a short event loop run.  Calling draw() synchronously on each
+        # canvas ensures both figures are rendered every frame regardless of
+        # focus.
         fig1.canvas.draw()
         fig2.canvas.draw()
-        plt.pause(max(args.pause, 0.0))
+
+        # Pump GUI events directly: the windows are already shown, so there is
+        # no need for plt.pause() to re-enter plt.show() on every frame. A
+        # non-positive timeout means "run until stopped" for
+        # start_event_loop(), so only flush pending events in that case.
+        if args.pause > 0.0:
+            fig1.canvas.start_event_loop(args.pause)
+        else:
+            fig1.canvas.flush_events()
 
         if dt > 0.0:
             next_t = t0 + (k + 1) * dt
@@ -1,14 +1,44 @@
 from __future__ import annotations
 
 import argparse
-import math
 import time
+from typing import Any, Callable
+
+
+def _make_blit_redraw(fig: Any, ax: Any, line: Any) -> Callable[[], None]:
+    """Return a per-frame redraw that only repaints `line` (blitting).
+
+    The static part of the figure (axes, ticks, title, grid) is rendered by a
+    regular draw and cached; each frame restores that background and draws
+    the animated line on top. Any full redraw (first show, resize) refreshes
+    the cached background via `draw_event`.
+    """
+
+    canvas = fig.canvas
+    line.set_animated(True)
+    background: list[Any] = []
+
+    def _on_draw(_evt: Any) -> None:
+        background[:] = [canvas.copy_from_bbox(fig.bbox)]
+        ax.draw_artist(line)
+
+    canvas.mpl_connect("draw_event", _on_draw)
+
+    def _redraw() -> None:
+        if not background:
+            canvas.draw()
+        canvas.restore_region(background[0])
+        ax.draw_artist(line)
+        canvas.blit(fig.bbox)
+
+    return _redraw
 
 
 def main(argv: list[str] | None = None) -> int:
     p = argparse.ArgumentParser(
         description=(
-            "High-FPS Matplotlib-native demo (two windows; line.set_ydata + plt.pause)."
+            "High-FPS Matplotlib-native demo"
+            " (two windows; line.set_ydata + canvas.start_event_loop)."
         )
     )
     p.add_argument("--fps", type=float, default=120.0, help="Target frames per second")
@@ -18,50 +48,94 @@ def main(argv: list[str] | None = None) -> int:
         "--pause",
         type=float,
         default=0.001,
-        help="plt.pause() dt (GUI event pumping)",
+        help="canvas.start_event_loop() dt (GUI event pumping; 0 only flushes events)",
+    )
+    p.add_argument(
+        "--blit",
+        action="store_true",
+        help="Repaint only the lines against a cached background (blitting)",
+    )
+    p.add_argument(
+        "--max-redraw-fps",
+        type=float,
+        default=60.0,
+        help="Cap on canvas redraws per second (data still updates every frame; 0 = no cap)",
     )
     args = p.parse_args(argv)
 
     import matplotlib.pyplot as plt
+    import numpy as np
 
     from matplotlib_window_tracker import hold_windows, is_interactive
 
     n = max(args.n, 10)
-    x = [i / (n - 1) for i in range(n)]
-    omega = 2.0 * math.pi
+    x = np.linspace(0.0, 1.0, n)
+    omega_x = 2.0 * np.pi * x
+
+    # Per-frame buffers, reused across frames to avoid allocations. Both
+    # windows plot the same phase-shifted argument, so it is computed once.
+    arg = np.empty(n)
+    y1 = np.zeros(n)
+    y2 = np.zeros(n)
 
     fig1, ax1 = plt.subplots(num="high_fps: sin", clear=True, figsize=(8, 4))
-    (line1,) = ax1.plot(x, [0.0 for _ in x])
+    (line1,) = ax1.plot(x, y1)
     ax1.set_ylim(-1.2, 1.2)
     ax1.grid(True, alpha=0.3)
     ax1.set_title("sin")
 
     fig2, ax2 = plt.subplots(num="high_fps: cos", clear=True, figsize=(8, 4))
-    (line2,) = ax2.plot(x, [0.0 for _ in x], color="tab:orange")
+    (line2,) = ax2.plot(x, y2, color="tab:orange")
     ax2.set_ylim(-1.2, 1.2)
     ax2.grid(True, alpha=0.3)
     ax2.set_title("cos")
 
+    redraw1: Callable[[], None] = fig1.canvas.draw
+    redraw2: Callable[[], None] = fig2.canvas.draw
+    if args.blit:
+        if fig1.canvas.supports_blit and fig2.canvas.supports_blit:
+            redraw1 = _make_blit_redraw(fig1, ax1, line1)
+            redraw2 = _make_blit_redraw(fig2, ax2, line2)
+        else:
+            print("[high_fps] backend does not support blitting; using full redraws")
+
+    # Show the windows once; the frame loop pumps GUI events directly
+    # (plt.pause() would call plt.show() again on every frame).
+    plt.show(block=False)
+
     fps = max(args.fps, 1.0)
     dt = 1.0 / fps
+    # Decouple the paint cadence from the data-update cadence: frames that
+    # arrive sooner than this after the last redraw only update the lines.
+    min_redraw_dt = 1.0 / args.max_redraw_fps if args.max_redraw_fps > 0.0 else 0.0
     t0 = time.perf_counter()
+    last_draw = float("-inf")
 
     behind = False
 
     for k in range(max(args.frames, 1)):
         frame_t0 = time.perf_counter()
         phase = 0.15 * k
-        line1.set_ydata([math.sin(omega * xi + phase) for xi in x])
-        line2.set_ydata([math.cos(omega * xi + phase) for xi in x])
+        np.add(omega_x, phase, out=arg)
+        np.sin(arg, out=y1)
+        np.cos(arg, out=y2)
+        line1.set_ydata(y1)
+        line2.set_ydata(y2)
 
         # Draw both canvases synchronously before pumping the event loop so
-        # Qt backends render both windows every frame (plt.pause only calls
-        # draw_idle on the active figure; the other window can be starved).
-        fig1.canvas.draw()
-        fig2.canvas.draw()
-
-        # Event pump.
-        plt.pause(max(args.pause, 0.0))
+        # Qt backends render both windows every frame (a deferred draw_idle
+        # on the inactive window can be starved by a short event loop run).
+        if frame_t0 - last_draw >= min_redraw_dt:
+            last_draw = frame_t0
+            redraw1()
+            redraw2()
+
+        # Event pump. A non-positive timeout means "run until stopped" for
+        # start_event_loop(), so only flush pending events in that case.
+        if args.pause > 0.0:
+            fig1.canvas.start_event_loop(args.pause)
+        else:
+            fig1.canvas.flush_events()
 
         work_dt = time.perf_counter() - frame_t0
         if not behind and work_dt > dt:
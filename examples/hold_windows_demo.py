@@ -14,9 +14,9 @@ def main() -> None:
     fig, ax = plt.subplots(num="hold_windows demo", clear=True)
     ax.plot([0, 1], [0, 1])
     ax.set_title("Close the window or press any key in the terminal")
-    fig.show()
 
-    # Nonblocking show; keep script alive via hold_windows().
+    # Nonblocking show (covers every open figure); keep script alive via
+    # hold_windows().
     plt.show(block=False)
     hold_windows()
 
@@ -1,7 +1,16 @@
 from __future__ import annotations
 
+import argparse
+
 from matplotlib_window_tracker.demos import two_windows_main
 
 
 if __name__ == "__main__":
-    two_windows_main()
+    parser = argparse.ArgumentParser(description="Plot sin/cos in tagged windows.")
+    parser.add_argument(
+        "--one-window",
+        action="store_true",
+        help="Plot both curves as subplots of a single window.",
+    )
+    args = parser.parse_args()
+    two_windows_main(one_window=args.one_window)
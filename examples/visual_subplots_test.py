@@ -5,7 +5,7 @@ import math
 import sys
 import threading
 import time
-from typing import Any
+from typing import Any, Callable
 
 
 def _process_events(fig: Any, dt: float) -> None:
@@ -23,14 +23,7 @@ def _process_events(fig: Any, dt: float) -> None:
 
 
 def _wait_for_enter_or_close(fig: Any, *, prompt: str) -> None:
-    import matplotlib.pyplot as plt
-
     closed = threading.Event()
-    try:
-        fig.canvas.mpl_connect("close_event", lambda evt: closed.set())  # type: ignore[attr-defined]
-    except Exception:
-        pass
-
     entered = threading.Event()
 
     def _wait() -> None:
@@ -43,40 +36,81 @@ def _wait_for_enter_or_close(fig: Any, *, prompt: str) -> None:
     t = threading.Thread(target=_wait, daemon=True)
     t.start()
 
+    canvas = fig.canvas  # type: ignore[attr-defined]
+
+    def _done() -> bool:
+        return entered.is_set() or closed.is_set()
+
+    # Let the GUI event loop run instead of re-entering it every few ms: a
+    # backend timer checks the stdin flag and stops the loop, and closing the
+    # window stops it directly.
+    def _on_tick() -> None:
+        if _done():
+            canvas.stop_event_loop()
+
+    def _on_close(_evt: Any) -> None:
+        closed.set()
+        canvas.stop_event_loop()
+
+    cid = None
+    timer = None
+    try:
+        cid = canvas.mpl_connect("close_event", _on_close)
+        timer = canvas.new_timer(interval=100)
+        timer.add_callback(_on_tick)
+        timer.start()
+    except Exception:
+        pass
+
     print(prompt, flush=True)
-    while not entered.is_set() and not closed.is_set():
-        try:
-            if not plt.fignum_exists(fig.number):
-                break
-        except Exception:
-            break
-        _process_events(fig, 0.05)
+    try:
+        # Bounded runs keep this working on backends whose timers never fire
+        # (e.g. Agg); on GUI backends the timer ends each run early.
+        while not _done():
+            _process_events(fig, 1.0)
+    finally:
+        if timer is not None:
+            timer.stop()
+        if cid is not None:
+            try:
+                canvas.mpl_disconnect(cid)
+            except Exception:
+                pass
 
 
 def _plot_step(ax: Any, *, step: int) -> None:
-    n = 400
-    x = [2.0 * math.pi * i / (n - 1) for i in range(n)]
-    y = [math.sin(v + 0.7 * step) for v in x]
+    import numpy as np
+
+    x = np.linspace(0.0, 2.0 * math.pi, 400)
+    y = np.sin(x + 0.7 * step)
     ax.plot(x, y, lw=2)
     ax.set_ylim(-1.2, 1.2)
     ax.grid(True, alpha=0.25)
     ax.set_title(f"visual_subplots_test step={step}")
 
 
-def _mk_fig_ax(*, call: str, num: str | None, clear: bool):
+def _subplots_num_kw(num: str | None, clear: bool):
     import matplotlib.pyplot as plt
 
-    if call == "pos":
-        if num is None:
-            return plt.subplots(1, 1, figsize=(7.0, 4.0))
-        return plt.subplots(1, 1, num=num, clear=clear, figsize=(7.0, 4.0))
+    if num is None:
+        return plt.subplots(1, 1, figsize=(7.0, 4.0))
+    return plt.subplots(1, 1, num=num, clear=clear, figsize=(7.0, 4.0))
+
+
+# --call name -> subplots() factory. subplots() takes nrows/ncols positionally,
+# so the "pos" variant ends up passing the figure identity as num= as well.
+_SUBPLOTS_CALLS: dict[str, Callable[[str | None, bool], Any]] = {
+    "pos": _subplots_num_kw,
+    "num_kw": _subplots_num_kw,
+}
 
-    if call == "num_kw":
-        if num is None:
-            return plt.subplots(1, 1, figsize=(7.0, 4.0))
-        return plt.subplots(1, 1, num=num, clear=clear, figsize=(7.0, 4.0))
 
-    raise SystemExit(f"unknown --call: {call!r}")
+def _mk_fig_ax(*, call: str, num: str | None, clear: bool):
+    try:
+        make = _SUBPLOTS_CALLS[call]
+    except KeyError:
+        raise SystemExit(f"unknown --call: {call!r}") from None
+    return make(num, clear)
 
 
 def main(argv: list[str] | None = None) -> int:
@@ -86,7 +120,7 @@ def main(argv: list[str] | None = None) -> int:
     p.add_argument(
         "--call",
         default="pos",
-        choices=("pos", "num_kw"),
+        choices=tuple(_SUBPLOTS_CALLS),
         help="How to pass the figure identity (positional vs num=)",
     )
     p.add_argument(
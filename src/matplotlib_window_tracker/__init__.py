@@ -1,18 +1,59 @@
 from __future__ import annotations
 
 from importlib.metadata import PackageNotFoundError, version
+from importlib.util import find_spec
+from typing import TYPE_CHECKING, Any
 
-try:
-    import matplotlib  # noqa: F401
-except ModuleNotFoundError as e:  # pragma: no cover
+# Fail early with a friendly message, but only check that matplotlib is
+# installed: importing it here would cost every `import` of this package.
+if find_spec("matplotlib") is None:  # pragma: no cover
     raise ModuleNotFoundError(
-        "matplotlib-window-tracker requires matplotlib. Install it first (e.g. `pip install matplotlib`)."
-    ) from e
+        "matplotlib-window-tracker requires matplotlib. Install it first (e.g. `pip install matplotlib`).",
+        name="matplotlib",
+    )
+
+if TYPE_CHECKING:
+    from .backends import raise_window, recommended_backend
+    from ._helpers import is_interactive
+    from .core import hold_windows
+    from .geometry_cache import WindowTracker, track_position_size
+
+# Public name -> defining submodule. Submodules are imported on first attribute
+# access (PEP 562), so importing the package stays cheap.
+_LAZY_EXPORTS = {
+    "hold_windows": ".core",
+    "is_interactive": "._helpers",
+    "raise_window": ".backends",
+    "recommended_backend": ".backends",
+    "track_position_size": ".geometry_cache",
+    "WindowTracker": ".geometry_cache",
+}
+
+# Submodules that used to be imported eagerly; `pkg.<submodule>` keeps working
+# without an explicit `import pkg.<submodule>`.
+_LAZY_SUBMODULES = frozenset(
+    {"_helpers", "backends", "core", "demos", "geometry_cache", "terminal"}
+)
+
+
+def __getattr__(name: str) -> Any:
+    from importlib import import_module
+
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        if name in _LAZY_SUBMODULES:
+            # Importing a submodule also binds it as a package attribute.
+            return import_module("." + name, __name__)
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
 
-from .backends import raise_window, recommended_backend
-from ._helpers import is_interactive
-from .core import hold_windows
-from .geometry_cache import WindowTracker, track_position_size
 
 try:
     __version__ = version("matplotlib-window-tracker")
@@ -8,20 +8,45 @@ from __future__ import annotations
 # Usage (after `pip install matplotlib-window-tracker`):
 #   matplotlib-patch [-y] install
 #   matplotlib-patch [-y] uninstall
+#
+# subprocess/shutil are imported only where pip or ldd is actually run, so
+# `--help` and argument errors stay cheap.
 
 import argparse
+import functools
 import os
 import platform
-import subprocess
 import sys
+import sysconfig
+from dataclasses import dataclass
 from importlib.metadata import PackageNotFoundError, version
 
 # ── Configuration ──────────────────────────────────────────────────────────────
 
-PATCHED_VERSION = "3.10.1.post1"
-PATCHED_TAG     = "v3.10.1.post1"
-BASE_URL        = "https://github.com/alberti42/fork-matplotlib/releases/download/v3.10.1.post1"
-SUPPORTED_PY    = {"311", "312", "313"}
+@dataclass(frozen=True, slots=True)
+class _Build:
+    """Release coordinates of the patched matplotlib fork."""
+    version: str
+    base_url: str
+    py_supported: frozenset[str]
+
+
+_BUILD = _Build(
+    version="3.10.1.post1",
+    base_url="https://github.com/alberti42/fork-matplotlib/releases/download/v3.10.1.post1",
+    py_supported=frozenset({"311", "312", "313"}),
+)
+
+# Skip pip's PyPI self-version probe and any interactive prompt, and never
+# fall back to building matplotlib from an sdist.
+_PIP_INSTALL = (
+    "-m", "pip", "install",
+    "--disable-pip-version-check",
+    "--no-input",
+    "--only-binary=:all:",
+    "--force-reinstall",
+    "--no-deps",
+)
 
 # ── Helpers ────────────────────────────────────────────────────────────────────
 
@@ -29,12 +54,55 @@ def _sep() -> None:
     print("------------------------------------------------------------")
 
 
+@functools.lru_cache(maxsize=None)
 def get_py_minor() -> str:
     """Return the running Python minor version as a two/three-digit string, e.g. '312'."""
     v = sys.version_info
     return f"{v.major}{v.minor}"
 
 
+@functools.lru_cache(maxsize=None)
+def _linux_is_musl() -> bool:
+    """Return True when running on a musl-based Linux (Alpine, etc.).
+
+    Prefers what the interpreter already knows about its own build (no
+    subprocess); spawning `ldd --version` is only the last resort. The result
+    is cached.
+    """
+    for var in ("SOABI", "HOST_GNU_TYPE", "MULTIARCH"):
+        if "musl" in (sysconfig.get_config_var(var) or ""):
+            return True
+
+    try:
+        libc, _ = platform.libc_ver()
+    except Exception:
+        libc = ""
+    if libc == "glibc":
+        return False
+    if libc == "musl":
+        return True
+
+    if os.path.isfile("/etc/alpine-release"):
+        return True
+
+    import shutil
+    import subprocess
+
+    if shutil.which("ldd") is None:
+        return False
+    try:
+        result = subprocess.run(
+            ["ldd", "--version"],
+            capture_output=True,
+            text=True,
+        )
+        combined = (result.stdout + result.stderr).lower()
+        return "musl" in combined
+    except Exception:
+        return False
+
+
+@functools.lru_cache(maxsize=None)
 def detect_platform_tag(py_minor: str) -> str:
     """Return the wheel platform tag for the current OS/arch.
 
@@ -56,20 +124,7 @@ def detect_platform_tag(py_minor: str) -> str:
 
     elif system == "Linux":
         # Detect musl (Alpine, etc.) vs glibc
-        is_musl = False
-        try:
-            result = subprocess.run(
-                ["ldd", "--version"],
-                capture_output=True,
-                text=True,
-            )
-            combined = (result.stdout + result.stderr).lower()
-            if "musl" in combined:
-                is_musl = True
-        except Exception:
-            pass
-        if not is_musl and os.path.isfile("/etc/alpine-release"):
-            is_musl = True
+        is_musl = _linux_is_musl()
 
         if machine == "x86_64":
             if is_musl:
@@ -96,14 +151,40 @@ def detect_platform_tag(py_minor: str) -> str:
         sys.exit(f"error: unsupported operating system: {system}")
 
 
+@functools.lru_cache(maxsize=None)
 def get_installed_mpl() -> str:
-    """Return the installed matplotlib version string, or '' if not found."""
+    """Return the installed matplotlib version string, or '' if not found.
+
+    Cached; call `get_installed_mpl.cache_clear()` after changing the install.
+    """
     try:
         return version("matplotlib")
     except PackageNotFoundError:
         return ""
 
 
+@functools.lru_cache(maxsize=None)
+def _wheel_url() -> tuple[str, str, str]:
+    """Return (url, wheel_file, platform_tag) of the wheel for this interpreter.
+
+    Raises SystemExit on unsupported Python versions or platforms.
+    """
+    py_minor = get_py_minor()
+
+    if py_minor not in _BUILD.py_supported:
+        py_full = platform.python_version()
+        sys.exit(
+            f"error: Python {py_full} is not supported by this release."
+            f" Supported: 3.11, 3.12, 3.13."
+        )
+
+    platform_tag = detect_platform_tag(py_minor)
+    py_tag       = f"cp{py_minor}"
+    wheel_file   = f"matplotlib-{_BUILD.version}-{py_tag}-{py_tag}-{platform_tag}.whl"
+    url          = f"{_BUILD.base_url}/{wheel_file}"
+    return url, wheel_file, platform_tag
+
+
 def confirm(prompt: str, yes: bool) -> bool:
     """Return True if the user (or --yes flag) confirms the action."""
     if yes:
@@ -117,25 +198,12 @@ def confirm(prompt: str, yes: bool) -> bool:
 # ── Subcommands ────────────────────────────────────────────────────────────────
 
 def cmd_install(yes: bool) -> None:
-    py_minor = get_py_minor()
-
-    if py_minor not in SUPPORTED_PY:
-        py_full = platform.python_version()
-        sys.exit(
-            f"error: Python {py_full} is not supported by this release."
-            f" Supported: 3.11, 3.12, 3.13."
-        )
-
-    platform_tag = detect_platform_tag(py_minor)
+    url, _wheel_file, platform_tag = _wheel_url()
     print(f"==> Platform: {platform_tag}")
 
-    py_tag    = f"cp{py_minor}"
-    wheel_file = f"matplotlib-{PATCHED_VERSION}-{py_tag}-{py_tag}-{platform_tag}.whl"
-    url        = f"{BASE_URL}/{wheel_file}"
-
     installed = get_installed_mpl()
-    if installed == PATCHED_VERSION:
-        print(f"==> Patched matplotlib {PATCHED_VERSION} is already installed. Nothing to do.")
+    if installed == _BUILD.version:
+        print(f"==> Patched matplotlib {_BUILD.version} is already installed. Nothing to do.")
         return
 
     print()
@@ -146,7 +214,7 @@ def cmd_install(yes: bool) -> None:
         print(f"  Current version : matplotlib {installed}")
     else:
         print("  Current version : (not installed)")
-    print(f"  New version     : matplotlib {PATCHED_VERSION}  [patched fork / prerelease]")
+    print(f"  New version     : matplotlib {_BUILD.version}  [patched fork / prerelease]")
     print(f"  Source          : {url}")
     _sep()
     print()
@@ -155,13 +223,15 @@ def cmd_install(yes: bool) -> None:
         print("Aborted.")
         return
 
+    import subprocess
+
     print()
     subprocess.run(
-        [sys.executable, "-m", "pip", "install", "--force-reinstall", "--no-deps", url],
+        [sys.executable, *_PIP_INSTALL, url],
         check=True,
     )
     print()
-    print(f"==> Done. Patched matplotlib {PATCHED_VERSION} installed.")
+    print(f"==> Done. Patched matplotlib {_BUILD.version} installed.")
 
 
 def cmd_uninstall(yes: bool) -> None:
@@ -196,13 +266,16 @@ def cmd_uninstall(yes: bool) -> None:
         print("Aborted.")
         return
 
+    import subprocess
+
     print()
     subprocess.run(
-        [sys.executable, "-m", "pip", "install", "--force-reinstall", "--no-deps", "matplotlib"],
+        [sys.executable, *_PIP_INSTALL, "matplotlib"],
         check=True,
     )
     print()
 
+    get_installed_mpl.cache_clear()
     restored = get_installed_mpl()
     print(f"==> Done. Official matplotlib {restored} restored.")
 
@@ -2,10 +2,14 @@ from __future__ import annotations
 
 import os
 import sys
-from typing import Any
+from typing import Any, Callable
 
 from ._helpers import _warn_once
 
+# Keep GUI toolkits (Qt bindings, tkinter, ...) out of module-level imports:
+# the `_raise_*` helpers only touch objects the active backend already created,
+# so calling `raise_window()` never loads a toolkit the program is not using.
+
 __all__ = [
     "recommended_backend",
     "raise_window",
@@ -40,22 +44,22 @@ def recommended_backend(
     ```
     """
 
-    import matplotlib
+    # Only ask Matplotlib for the current backend when it is the answer:
+    # `get_backend()` may resolve the "auto" backend, which imports pyplot and
+    # probes GUI toolkits.
+    if respect_existing and (
+        os.environ.get("MPLBACKEND") or "matplotlib.pyplot" in sys.modules
+    ):
+        import matplotlib
 
-    try:
-        current = str(matplotlib.get_backend())
-    except Exception as e:
-        _warn_once(
-            "recommended_backend:get_backend",
-            "matplotlib_window_tracker.recommended_backend: matplotlib.get_backend() failed; using platform default",
-            e,
-        )
-        current = ""
-    if respect_existing:
-        if os.environ.get("MPLBACKEND"):
-            return current
-        if "matplotlib.pyplot" in sys.modules:
-            return current
+        try:
+            return str(matplotlib.get_backend())
+        except Exception as e:
+            _warn_once(
+                "recommended_backend:get_backend",
+                "matplotlib_window_tracker.recommended_backend: matplotlib.get_backend() failed; using platform default",
+                e,
+            )
 
     plat = sys.platform
     if plat == "darwin":
@@ -92,21 +96,71 @@ def raise_window(fig: Any) -> None:
         pass
 
     try:
-        import matplotlib
-
-        backend = str(matplotlib.get_backend()).lower()
+        family = _canvas_family(fig.canvas)  # type: ignore[attr-defined]
     except Exception:
-        backend = ""
+        family = ""
+
+    raiser = _RAISERS.get(family)
+    if raiser is not None:
+        raiser(fig)
+
+
+# Backend module suffix (`matplotlib.backends.backend_<name>`) -> family,
+# seeded with Matplotlib's built-in canvas modules; other names are classified
+# once and added.
+_BACKEND_FAMILIES: dict[str, str] = {
+    "macosx": "macosx",
+    "qtagg": "qt",
+    "qtcairo": "qt",
+    "tkagg": "tk",
+    "tkcairo": "tk",
+    "agg": "",
+    "cairo": "",
+    "pdf": "",
+    "pgf": "",
+    "ps": "",
+    "svg": "",
+    "template": "",
+}
+
+
+def _backend_family(backend: str) -> str:
+    """Classify a backend module suffix as "macosx", "qt", "tk", or "" (other)."""
+
+    family = _BACKEND_FAMILIES.get(backend)
+    if family is not None:
+        return family
+
+    if backend.startswith("macosx"):
+        family = "macosx"
+    elif backend.startswith("qt"):
+        family = "qt"
+    elif backend.startswith("tk"):
+        family = "tk"
+    else:
+        family = ""
+    _BACKEND_FAMILIES[backend] = family
+    return family
+
+
+_BUILTIN_CANVAS_PREFIX = "matplotlib.backends.backend_"
+
+
+def _canvas_family(canvas: Any) -> str:
+    """Classify the backend that created `canvas` from its class hierarchy.
+
+    This reads the figure's own canvas type instead of `matplotlib.get_backend()`,
+    so no rcParams access is needed and the answer stays right for figures
+    created before a backend switch. The first base class defined in a built-in
+    `matplotlib.backends.backend_*` module decides, so application subclasses of
+    e.g. `FigureCanvasQTAgg` are classified too; other canvases are "" (other).
+    """
 
-    if "macosx" in backend:
-        _raise_macosx(fig)
-        return
-    if "qtagg" in backend or backend.startswith("qt"):
-        _raise_qt(fig)
-        return
-    if "tkagg" in backend or backend.startswith("tk"):
-        _raise_tk(fig)
-        return
+    for klass in type(canvas).__mro__:
+        module = getattr(klass, "__module__", None) or ""
+        if module.startswith(_BUILTIN_CANVAS_PREFIX):
+            return _backend_family(module[len(_BUILTIN_CANVAS_PREFIX) :])
+    return ""
 
 
 def _raise_macosx(fig: Any) -> None:
@@ -160,3 +214,11 @@ def _raise_tk(fig: Any) -> None:
             focus()
     except Exception:
         return
+
+
+# Backend family -> fallback raiser used by `raise_window()`.
+_RAISERS: dict[str, Callable[[Any], None]] = {
+    "macosx": _raise_macosx,
+    "qt": _raise_qt,
+    "tk": _raise_tk,
+}
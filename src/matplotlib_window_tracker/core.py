@@ -1,8 +1,7 @@
 from __future__ import annotations
 
-import contextlib
 import sys
-from typing import Literal
+from typing import Any, Callable, Literal
 
 from .terminal import _make_anykey_checker, _make_enterkey_checker
 
@@ -39,6 +38,8 @@ def hold_windows(
 
     Parameters:
     - poll: seconds to wait between GUI event processing steps.
+      If `poll <= 0`, pending GUI events are flushed without waiting
+      (`canvas.flush_events()`), which is responsive but keeps a CPU core busy.
     - prompt: message printed before waiting.
       - If omitted, a default prompt is printed based on `trigger`.
       - If None, nothing is printed.
@@ -47,8 +48,6 @@ def hold_windows(
       This avoids blocking in non-interactive environments (CI, piped input).
     """
 
-    import threading
-
     import matplotlib.pyplot as plt
 
     if only_if_tty:
@@ -83,27 +82,61 @@ def hold_windows(
     else:
         key_ctx, key_pressed, _ = _make_enterkey_checker()
 
+    # The event pump is resolved once per figure rather than on every tick; it
+    # is only re-resolved when the figure it belongs to has been closed.
+    # `start_event_loop(0)` / `plt.pause(0)` would run the GUI loop with no
+    # timeout, so a non-positive poll only flushes pending events instead.
+    flush_only = poll <= 0
+    pump_num: Any = None
+    pump: Callable[[float], Any] = plt.pause
+
     with key_ctx:
         while True:
             try:
-                if not plt.get_fignums():
-                    return
+                fignums = plt.get_fignums()
             except Exception:
                 return
+            if not fignums:
+                return
 
             if key_pressed():
                 return
 
+            if pump_num not in fignums:
+                pump_num = fignums[0]
+                pump = _resolve_event_pump(pump_num, flush_only=flush_only)
+
             # Keep processing GUI events without repeatedly calling plt.show().
             try:
-                fignums = plt.get_fignums()
-                fig = plt.figure(fignums[0]) if fignums else None
-                start_loop = getattr(
-                    getattr(fig, "canvas", None), "start_event_loop", None
-                )
-                if callable(start_loop):
-                    start_loop(poll)
-                else:
-                    plt.pause(poll)
+                pump(poll)
             except Exception:
-                plt.pause(poll)
+                if not flush_only:
+                    plt.pause(poll)
+
+
+def _resolve_event_pump(
+    num: Any, *, flush_only: bool = False
+) -> Callable[[float], Any]:
+    """Return a callable that processes GUI events for `poll` seconds.
+
+    Prefers the figure canvas' `start_event_loop` (no implicit `plt.show()`),
+    falling back to `plt.pause`. With `flush_only=True`, the callable ignores
+    `poll` and only runs `canvas.flush_events()`.
+    """
+
+    import matplotlib.pyplot as plt
+
+    try:
+        fig = plt.figure(num)
+        canvas = getattr(fig, "canvas", None)
+        if flush_only:
+            flush = getattr(canvas, "flush_events", None)
+            if callable(flush):
+                return lambda _poll: flush()
+        else:
+            start_loop = getattr(canvas, "start_event_loop", None)
+            if callable(start_loop):
+                return start_loop
+    except Exception:
+        pass
+    return (lambda _poll: None) if flush_only else plt.pause
@@ -1,21 +1,24 @@
 from __future__ import annotations
 
-import math
 from datetime import datetime
 from typing import Any
 
 from ._helpers import is_interactive
 
 
-def two_windows_main() -> None:
+def two_windows_main(*, one_window: bool = False) -> None:
     """Open two tagged windows plotting sin/cos.
 
+    With `one_window=True`, both curves go into a single window with two
+    stacked subplots, so only one figure has to be drawn and shown.
+
     In IPython, it is still recommended to select a GUI backend explicitly, e.g.:
     - macOS: %matplotlib macosx
     - Linux: %matplotlib qt  (fallback: %matplotlib tk)
     """
 
     import matplotlib.pyplot as plt
+    import numpy as np
 
     # Backend selection is intentionally explicit. In IPython, use:
     #   %matplotlib macosx  (macOS)
@@ -28,51 +31,42 @@ def two_windows_main() -> None:
     stamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S.%f")[:-3]
 
     n = 400
-    x = [i / (n - 1) for i in range(n)]
-    y_sin = [math.sin(2.0 * math.pi * xi) for xi in x]
-    y_cos = [math.cos(2.0 * math.pi * xi) for xi in x]
-
-    def _require_axes(ax: Any, *, name: str) -> Any:
-        """Validate the demo got a single Axes, not an array."""
-
-        # In this demo we expect a single Axes (nrows=ncols=1). Fail fast if the
-        # Matplotlib return shape changes.
-        if hasattr(ax, "plot") and hasattr(ax, "set_title"):
-            return ax
-        raise TypeError(
-            f"Expected a single Matplotlib Axes for {name}, got {type(ax)!r}"
+    x = np.linspace(0.0, 1.0, n)
+    tau_x = 2.0 * np.pi * x
+    y_sin = np.sin(tau_x)
+    y_cos = np.cos(tau_x)
+
+    if one_window:
+        _, (ax1, ax2) = plt.subplots(
+            2,
+            1,
+            num="sin/cos(2pi x)",
+            clear=True,
+            figsize=(8, 8),
+            constrained_layout=True,
         )
-
-    fig1, ax1 = plt.subplots(
-        1,
-        1,
-        num="sin(2pi x)",
-        clear=True,
-        figsize=(8, 4),
-        constrained_layout=True,
-    )
-    ax1 = _require_axes(ax1, name="ax1")
-    ax1.plot(x, y_sin)
-    ax1.set_title(f"sin(2pi x)  [{stamp}]")
-    ax1.grid(True, alpha=0.3)
-
-    fig2, ax2 = plt.subplots(
-        1,
-        1,
-        num="cos(2pi x)",
-        clear=True,
-        figsize=(8, 4),
-        constrained_layout=True,
-    )
-    ax2 = _require_axes(ax2, name="ax2")
-    ax2.plot(x, y_cos, color="tab:orange")
-    ax2.set_title(f"cos(2pi x)  [{stamp}]")
-    ax2.grid(True, alpha=0.3)
+    else:
+        # With nrows=ncols=1 (and squeeze=True), `subplots` returns a single Axes.
+        subplot_kw: dict[str, Any] = {
+            "clear": True,
+            "figsize": (8, 4),
+            "constrained_layout": True,
+        }
+        _, ax1 = plt.subplots(1, 1, num="sin(2pi x)", **subplot_kw)
+        _, ax2 = plt.subplots(1, 1, num="cos(2pi x)", **subplot_kw)
+
+    def _plot(ax: Any, y: Any, title: str, **line_kw: Any) -> None:
+        """Draw one curve with the demo's shared styling."""
+
+        ax.plot(x, y, **line_kw)
+        ax.set_title(f"{title}  [{stamp}]")
+        ax.grid(True, alpha=0.3)
+
+    _plot(ax1, y_sin, "sin(2pi x)")
+    _plot(ax2, y_cos, "cos(2pi x)", color="tab:orange")
 
     if is_interactive():
         # Nonblocking: let Matplotlib pump events for all open figures.
-        import matplotlib.pyplot as plt
-
         plt.show(block=False)
         return
 
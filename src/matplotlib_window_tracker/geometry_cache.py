@@ -1,5 +1,8 @@
 from __future__ import annotations
 
+import atexit
+import functools
+import json
 import os
 import sys
 from datetime import datetime, timezone
@@ -7,16 +10,44 @@ from pathlib import Path
 from typing import Any
 
 import platform
+import queue
+import threading
 import uuid
 import weakref
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 
 from ._helpers import is_interactive
 
+try:  # Optional C-accelerated JSON codec (`pip install "...[fast]"`).
+    import orjson as _orjson
+except ImportError:
+    _orjson = None
+
 
 _CACHE_VERSION = 1
 
+# Directory (under the resolved cache root) holding the cache file.
+_CACHE_SUBDIR = ".matplotlib-window-tracker"
+
+# Quiet period after a move/resize end event before the frame is written; a
+# single drag can emit several end events.
+_SAVE_DEBOUNCE_MS = 250
+
+# Raw `os.open` file descriptors are text mode on Windows unless asked otherwise.
+_O_BINARY = getattr(os, "O_BINARY", 0)
+
+# Manager events after which the window frame is saved.
+_TRACKED_EVENTS = ("window_move_end_event", "window_resize_end_event")
+
+# Serializes read-modify-write cycles of the cache file within this process
+# (GUI thread and background writer).
+_WRITE_LOCK = threading.Lock()
+
+# path -> (file signature, cache) for the last cache this process read or
+# wrote, so repeated saves don't re-read and re-parse a file we just wrote.
+_SNAPSHOTS: dict[Path, tuple[tuple[int, int, int], dict[str, Any]]] = {}
+
 
 __all__ = [
     "WindowTracker",
@@ -24,6 +55,7 @@ __all__ = [
 ]
 
 
+@functools.cache
 def _machine_id() -> str:
     """Return a machine identifier string used to separate cache entries.
 
@@ -31,6 +63,7 @@ def _machine_id() -> str:
     - Uses `uuid.getnode()` which is typically the MAC address (48-bit int).
     - On some systems it may be a random value; that is still acceptable for the
       purpose of separating cache entries across machines.
+    - Computed once per process; `getnode()` may scan network interfaces.
     """
 
     # uuid.getnode() is usually the MAC address (48-bit int). It may be random on
@@ -41,8 +74,12 @@ def _machine_id() -> str:
         return "unknown"
 
 
+@functools.cache
 def _hostname() -> str:
-    """Return the host name (best-effort, for human-readable cache metadata)."""
+    """Return the host name (best-effort, for human-readable cache metadata).
+
+    Computed once per process.
+    """
 
     try:
         return platform.node()
@@ -72,6 +109,8 @@ def _coerce_cache(data: Any) -> dict[str, Any]:
     This function never raises.
     - If the input is not a valid v1 cache mapping, it returns an empty cache.
     - Unknown versions are treated as empty (no migration in MVP).
+    - A valid mapping is trimmed and returned in place (the input is freshly
+      parsed JSON owned by the caller), so no containers are rebuilt.
     """
 
     if not isinstance(data, dict):
@@ -88,42 +127,33 @@ def _coerce_cache(data: Any) -> dict[str, Any]:
         return _new_cache()
 
     # Keep only the keys we understand to avoid growing garbage.
-    return {
-        "version": _CACHE_VERSION,
-        "machines": machines,
-        "entries": entries,
-    }
+    data["version"] = _CACHE_VERSION
+    if len(data) != 3:
+        for key in [k for k in data if k not in ("version", "machines", "entries")]:
+            del data[key]
+    return data
 
 
 def _get_machine_entry(cache: dict[str, Any], machine_id: str) -> dict[str, Any] | None:
     """Return cache['machines'][machine_id] if present and well-formed."""
 
     try:
-        machines = cache.get("machines")
-        if not isinstance(machines, dict):
-            return None
-        v = machines.get(machine_id)
-        if not isinstance(v, dict):
-            return None
-        return v
-    except Exception:
+        v = cache["machines"][machine_id]
+    except (KeyError, TypeError):
         return None
+    return v if isinstance(v, dict) else None
 
 
 def _ensure_machine_record(cache: dict[str, Any], machine_id: str) -> None:
     """Ensure a machine metadata record exists for `machine_id` (in-place)."""
 
     try:
-        machines = cache.setdefault("machines", {})
-        if not isinstance(machines, dict):
-            return
-        machines.setdefault(
-            machine_id,
-            {
-                "hostname": _hostname(),
-            },
-        )
-    except Exception:
+        machines = cache.get("machines")
+        if machines is None:
+            machines = cache["machines"] = {}
+        if machine_id not in machines:
+            machines[machine_id] = {"hostname": _hostname()}
+    except (TypeError, AttributeError):
         return
 
 
@@ -140,18 +170,10 @@ def _get_entry(
         return None
 
     try:
-        entries = cache.get("entries")
-        if not isinstance(entries, dict):
-            return None
-        per_tag = entries.get(tag)
-        if not isinstance(per_tag, dict):
-            return None
-        per_machine = per_tag.get(machine_id)
-        if not isinstance(per_machine, dict):
-            return None
-        return per_machine
-    except Exception:
+        per_machine = cache["entries"][tag][machine_id]
+    except (KeyError, TypeError):
         return None
+    return per_machine if isinstance(per_machine, dict) else None
 
 
 def _set_entry(
@@ -174,15 +196,17 @@ def _set_entry(
 
     _ensure_machine_record(cache, machine_id)
 
+    # Plain lookups rather than `setdefault`, which would build a throwaway
+    # empty dict on every call.
     try:
-        entries = cache.setdefault("entries", {})
-        if not isinstance(entries, dict):
-            return
-        per_tag = entries.setdefault(tag, {})
-        if not isinstance(per_tag, dict):
-            return
+        entries = cache.get("entries")
+        if entries is None:
+            entries = cache["entries"] = {}
+        per_tag = entries.get(tag)
+        if per_tag is None:
+            per_tag = entries[tag] = {}
         per_tag[machine_id] = entry
-    except Exception:
+    except (TypeError, AttributeError):
         return
 
 
@@ -203,41 +227,63 @@ def _resolve_cache_dir(cache_dir: str | os.PathLike[str] | None) -> Path:
     falls back to the current working directory.
     """
 
+    return Path(_cache_dir_str(cache_dir))
+
+
+def _cache_dir_str(cache_dir: str | os.PathLike[str] | None) -> str:
+    """`_resolve_cache_dir` on plain strings (see there)."""
+
     if cache_dir is not None:
-        root = Path(cache_dir)
-        return root / ".matplotlib-window-tracker"
+        return os.path.join(os.fspath(cache_dir), _CACHE_SUBDIR)
 
     env = os.environ.get("MATPLOTLIB_WINDOW_TRACKER_CACHE_DIR")
     if env:
-        return Path(env) / ".matplotlib-window-tracker"
+        return os.path.join(env, _CACHE_SUBDIR)
 
     if is_interactive():
-        return Path.cwd() / ".matplotlib-window-tracker"
+        return os.path.join(os.getcwd(), _CACHE_SUBDIR)
 
     # Script mode: try to use the entry script directory.
     try:
-        argv0 = sys.argv[0]
+        argv0 = os.path.expanduser(str(sys.argv[0]))
     except Exception:
         argv0 = ""
 
-    try:
-        p = Path(argv0).expanduser()
-    except Exception:
-        p = Path(".")
+    # Only a relative `argv0` depends on the working directory; an absolute one
+    # is resolved without touching it (it may have been deleted).
+    cwd = "" if os.path.isabs(argv0) else os.getcwd()
+    script_dir = _script_cache_dir(argv0, cwd)
+    if script_dir is not None:
+        return script_dir
+
+    return os.path.join(cwd or os.getcwd(), _CACHE_SUBDIR)
+
+
+@functools.lru_cache(maxsize=8)
+def _script_cache_dir(argv0: str, cwd: str) -> str | None:
+    """Return the cache directory next to entry script `argv0`, or None.
+
+    Cached: the lookup stats and resolves the script path, and a program
+    typically tracks several windows from the same entry script. `cwd` is part
+    of the key because a relative `argv0` is resolved against it ("" for an
+    absolute `argv0`).
+    """
 
     try:
-        if p.suffix == ".py" and p.exists():
-            return p.resolve().parent / ".matplotlib-window-tracker"
+        if os.path.splitext(argv0)[1] == ".py" and os.path.exists(argv0):
+            return os.path.join(
+                os.path.dirname(os.path.realpath(argv0)), _CACHE_SUBDIR
+            )
     except Exception:
         pass
 
-    return Path.cwd() / ".matplotlib-window-tracker"
+    return None
 
 
 def _cache_file_path(cache_dir: str | os.PathLike[str] | None) -> Path:
     """Return the full path to the cache JSON file."""
 
-    return _resolve_cache_dir(cache_dir) / "window_geometry.json"
+    return Path(os.path.join(_cache_dir_str(cache_dir), "window_geometry.json"))
 
 
 def _ensure_parent_dir(path: Path) -> None:
@@ -249,6 +295,26 @@ def _ensure_parent_dir(path: Path) -> None:
         return
 
 
+def _read_file_bytes(path: Path) -> bytes:
+    """Read a whole file with plain `os.open`/`os.read`.
+
+    The cache file is small, so this skips the buffered-file layer (and its
+    extra fstat/lseek calls) that `Path.read_bytes()` goes through.
+    """
+
+    fd = os.open(path, os.O_RDONLY | _O_BINARY)
+    try:
+        chunks: list[bytes] = []
+        while True:
+            chunk = os.read(fd, 1 << 16)
+            if not chunk:
+                break
+            chunks.append(chunk)
+    finally:
+        os.close(fd)
+    return b"".join(chunks)
+
+
 def _read_json(path: Path) -> dict[str, Any] | None:
     """Read a JSON mapping from disk.
 
@@ -256,21 +322,50 @@ def _read_json(path: Path) -> dict[str, Any] | None:
     """
 
     try:
-        import json
+        raw = _read_file_bytes(path)
+    except Exception:
+        return None
+
+    if _orjson is not None:
+        try:
+            return _orjson.loads(raw)
+        except Exception:
+            pass
 
-        data = path.read_text(encoding="utf-8")
-        return json.loads(data)
+    try:
+        return json.loads(raw)
     except Exception:
         return None
 
 
-def _has_attrs(obj: Any, names: tuple[str, ...]) -> bool:
-    """Return True if `obj` has all named attributes."""
+# Manager methods `track_position_size` relies on.
+_MANAGER_API = (
+    "get_window_frame",
+    "set_window_frame",
+    "raise_window",
+    "mpl_connect",
+    "mpl_disconnect",
+)
 
-    for n in names:
-        if not hasattr(obj, n):
-            return False
-    return True
+
+@functools.lru_cache(maxsize=32)
+def _manager_class_supported(mgr_type: type) -> bool:
+    """Return True if `mgr_type` defines all of `_MANAGER_API` (cached per class)."""
+
+    return all(hasattr(mgr_type, name) for name in _MANAGER_API)
+
+
+def _manager_supported(mgr: Any) -> bool:
+    """Return True if `mgr` exposes the window-frame APIs.
+
+    The per-class check is a cached fast path for regular backend managers.
+    Managers providing the methods per instance (or forwarding them through
+    `__getattr__`, e.g. proxies) are checked on the instance, uncached.
+    """
+
+    if _manager_class_supported(type(mgr)):
+        return True
+    return all(hasattr(mgr, name) for name in _MANAGER_API)
 
 
 def _get_window_level_floating(mgr: Any) -> bool | None:
@@ -291,34 +386,45 @@ def _get_window_level_floating(mgr: Any) -> bool | None:
     return None
 
 
-def _mk_entry_from_manager(
+def _manager_fingerprint(
     mgr: Any,
     *,
     window_level_floating: bool | None,
-) -> dict[str, Any] | None:
-    """Build a cache entry dict by querying a Matplotlib manager.
+) -> tuple[Any, Any] | None:
+    """Return the `_entry_fingerprint` of the manager's current window state.
+
+    Callers compare it with the last saved fingerprint and only build an entry
+    (`_entry_from_fingerprint`) when the state changed. Returns None when the
+    frame cannot be queried.
 
     Requires upstream macOS manager APIs:
     - get_window_frame
     """
 
     try:
-        frame = list(mgr.get_window_frame())
+        frame = tuple(mgr.get_window_frame())
     except Exception:
         return None
 
-    out: dict[str, Any] = {
-        "frame": frame,
-        "updated_at": _utc_now_iso(),
-    }
-
     # Prefer live value from the manager when available.
     live_level = _get_window_level_floating(mgr)
     if live_level is not None:
-        out["window_level_floating"] = live_level
-    elif window_level_floating is not None:
-        out["window_level_floating"] = bool(window_level_floating)
+        return (frame, live_level)
+    if window_level_floating is not None:
+        return (frame, bool(window_level_floating))
+    return (frame, None)
+
 
+def _entry_from_fingerprint(fp: tuple[Any, Any]) -> dict[str, Any]:
+    """Build a cache entry dict from a `_manager_fingerprint` result."""
+
+    frame, floating = fp
+    # `updated_at` is stamped by `_upsert_entry`, only when a write happens.
+    out: dict[str, Any] = {
+        "frame": list(frame),
+    }
+    if floating is not None:
+        out["window_level_floating"] = floating
     return out
 
 
@@ -342,13 +448,8 @@ def _restore_from_cache(
         x, y, w, h = frame
         mgr.set_window_frame(x, y, w, h)
 
-        floating: bool | None = None
-        try:
-            v = entry.get("window_level_floating")
-            if isinstance(v, bool):
-                floating = v
-        except Exception:
-            floating = None
+        v = entry.get("window_level_floating")
+        floating = v if isinstance(v, bool) else None
 
         if floating is not None and hasattr(mgr, "set_window_level"):
             try:
@@ -361,7 +462,195 @@ def _restore_from_cache(
         return None
 
 
-@dataclass(frozen=True)
+def _is_inert_timer(timer: Any) -> bool:
+    """Return True for a bare `TimerBase`, which non-GUI canvases return.
+
+    It has no event loop behind it and never fires.
+    """
+
+    backend_bases = sys.modules.get("matplotlib.backend_bases")
+    return backend_bases is not None and type(timer) is backend_bases.TimerBase
+
+
+class _Debouncer:
+    """Coalesce bursts of `request()` calls into one `callback()` call.
+
+    The callback runs once no request arrived for `interval_ms`, driven by a
+    GUI timer from the figure canvas so it runs on the main thread. When no
+    timer is available, requests run the callback immediately. That includes
+    non-GUI canvases (Agg, ...), whose plain `TimerBase` never fires.
+    """
+
+    __slots__ = (
+        "_fig_ref",
+        "_callback",
+        "_interval_ms",
+        "_timer",
+        "_no_timer",
+        "_pending",
+    )
+
+    def __init__(
+        self, fig_ref: weakref.ReferenceType[Any], callback: Any, interval_ms: int
+    ) -> None:
+        self._fig_ref = fig_ref
+        self._callback = callback
+        self._interval_ms = interval_ms
+        self._timer: Any = None
+        self._no_timer = False
+        self._pending = False
+
+    def _get_timer(self) -> Any:
+        if self._timer is None and not self._no_timer:
+            fig = self._fig_ref()
+            try:
+                timer = fig.canvas.new_timer(interval=self._interval_ms)  # type: ignore[union-attr]
+                if _is_inert_timer(timer):
+                    self._no_timer = True
+                    return None
+                timer.single_shot = True
+                timer.add_callback(self._fire)
+            except Exception:
+                return None
+            self._timer = timer
+        return self._timer
+
+    def _fire(self) -> None:
+        if not self._pending:
+            return
+        self._pending = False
+        try:
+            self._callback()
+        except Exception:
+            pass
+
+    def request(self) -> None:
+        """Schedule the callback, restarting the quiet period."""
+
+        self._pending = True
+        timer = self._get_timer()
+        if timer is None:
+            self._fire()
+            return
+        try:
+            timer.stop()
+            timer.start()
+        except Exception:
+            self._fire()
+
+    def cancel(self) -> None:
+        """Drop a scheduled callback without running it."""
+
+        self._pending = False
+        if self._timer is not None:
+            try:
+                self._timer.stop()
+            except Exception:
+                pass
+
+    def flush(self) -> None:
+        """Run a scheduled callback now."""
+
+        if self._timer is not None:
+            try:
+                self._timer.stop()
+            except Exception:
+                pass
+        self._fire()
+
+    @property
+    def has_timer(self) -> bool:
+        """True when callbacks are driven by a firing GUI timer.
+
+        Only GUI backends provide one; with it, the callback runs from their
+        event loop.
+        """
+
+        return self._timer is not None
+
+
+class _BackgroundWriter:
+    """Run cache writes in submission order on one daemon thread.
+
+    The thread is started on first use. Keeps file I/O off the GUI thread;
+    `flush()` waits until every submitted write has completed.
+    """
+
+    __slots__ = ("_jobs", "_lock", "_thread")
+
+    def __init__(self) -> None:
+        self._jobs: queue.Queue[Any] = queue.Queue()
+        self._lock = threading.Lock()
+        self._thread: threading.Thread | None = None
+
+    def _run(self) -> None:
+        while True:
+            job = self._jobs.get()
+            try:
+                job()
+            except Exception:
+                pass
+            finally:
+                self._jobs.task_done()
+
+    def submit(self, job: Any) -> None:
+        """Queue `job()`; runs it inline if no worker thread can be started."""
+
+        with self._lock:
+            if self._thread is None:
+                try:
+                    t = threading.Thread(
+                        target=self._run,
+                        name="matplotlib-window-tracker-writer",
+                        daemon=True,
+                    )
+                    t.start()
+                except Exception:
+                    t = None
+                self._thread = t
+            started = self._thread is not None
+        if not started:
+            try:
+                job()
+            except Exception:
+                pass
+            return
+        self._jobs.put(job)
+
+    def flush(self) -> None:
+        """Block until all submitted writes have completed."""
+
+        if self._thread is not None and self._thread is not threading.current_thread():
+            self._jobs.join()
+
+
+_WRITER = _BackgroundWriter()
+
+# id(tracker) -> tracker for trackers holding a save that waits for its
+# debounce timer; `_flush_pending_saves` writes them at interpreter exit.
+_PENDING_TRACKERS: dict[int, WindowTracker] = {}
+
+
+def _flush_pending_saves() -> None:
+    """Write saves still waiting for their debounce period (atexit hook).
+
+    Without this, closing the program right after moving a window would drop
+    the last frame. Never raises.
+    """
+
+    _WRITER.flush()
+    for tracker in list(_PENDING_TRACKERS.values()):
+        try:
+            tracker._debouncer.cancel()
+            tracker._write_pending(sync=True)
+        except Exception:
+            continue
+
+
+atexit.register(_flush_pending_saves)
+
+
+@dataclass(frozen=True, slots=True)
 class WindowTracker:
     """Handle returned by `track_position_size`.
 
@@ -375,13 +664,38 @@ class WindowTracker:
     machine_id: str
     _fig_ref: weakref.ReferenceType[Any]
     _mgr_ref: weakref.ReferenceType[Any]
-    _cids: tuple[int, int]
-    _last_saved_fp: tuple[Any, Any, Any, Any] | None
+    _cids: tuple[int, ...]
+    _last_saved_fp: tuple[Any, Any] | None
     _window_level_floating: bool | None
+    # (entry, fingerprint) captured by the last end event, awaiting its
+    # debounced write.
+    _pending: tuple[dict[str, Any], tuple[Any, Any]] | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    _debouncer: _Debouncer = field(init=False, repr=False, compare=False)
+    # Fingerprint of the newest save handed to a writer, maintained on the GUI
+    # thread. `_last_saved_fp` is only updated once a write lands (possibly on
+    # the background writer), so it can lag behind while a write is queued.
+    _last_submitted_fp: tuple[Any, Any] | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
+    def __post_init__(self) -> None:
+        object.__setattr__(
+            self,
+            "_debouncer",
+            _Debouncer(self._fig_ref, self._write_pending, _SAVE_DEBOUNCE_MS),
+        )
+        object.__setattr__(self, "_last_submitted_fp", self._last_saved_fp)
 
     def disconnect(self) -> None:
-        """Disconnect the installed Matplotlib callbacks (best-effort)."""
+        """Disconnect the installed Matplotlib callbacks (best-effort).
+
+        A save still waiting for its debounce period is written first.
+        """
 
+        self._debouncer.flush()
+        _WRITER.flush()
         mgr = self._mgr_ref()
         if mgr is None:
             return
@@ -402,21 +716,80 @@ class WindowTracker:
         except Exception:
             return
 
+    def _on_end_event(self, *_args: Any, **_kwargs: Any) -> None:
+        """Capture the frame after a move/resize; the write is debounced.
+
+        The frame is read when the event fires, so a later flush never needs
+        the (possibly closed) window.
+        """
+
+        mgr = self._mgr_ref()
+        if mgr is None:
+            return
+        fp = _manager_fingerprint(
+            mgr,
+            window_level_floating=self._window_level_floating,
+        )
+        if fp is None:
+            return
+        if self._last_submitted_fp is not None and fp == self._last_submitted_fp:
+            # Moved back to the frame last handed to the writer: drop any
+            # write still pending.
+            self._cancel_pending()
+            return
+        pending = self._pending
+        if pending is not None and pending[1] == fp:
+            # Same frame as the write already scheduled.
+            return
+
+        object.__setattr__(self, "_pending", (_entry_from_fingerprint(fp), fp))
+        _PENDING_TRACKERS[id(self)] = self
+        self._debouncer.request()
+
+    def _cancel_pending(self) -> None:
+        object.__setattr__(self, "_pending", None)
+        _PENDING_TRACKERS.pop(id(self), None)
+        self._debouncer.cancel()
+
+    def _write_pending(self, *, sync: bool = False) -> None:
+        pending = self._pending
+        if pending is None:
+            return
+        object.__setattr__(self, "_pending", None)
+        _PENDING_TRACKERS.pop(id(self), None)
+        entry, fp = pending
+        object.__setattr__(self, "_last_submitted_fp", fp)
+        if self._debouncer.has_timer and not sync:
+            # Fired from the GUI event loop: do the disk I/O off that thread.
+            _WRITER.submit(functools.partial(self._write_entry, entry, fp))
+        else:
+            self._write_entry(entry, fp)
+
     def _save_from_mgr(self, *, force: bool = False) -> bool:
         mgr = self._mgr_ref()
         if mgr is None:
             return False
-        entry = _mk_entry_from_manager(
+        fp = _manager_fingerprint(
             mgr,
             window_level_floating=self._window_level_floating,
         )
-        if entry is None:
+        if fp is None:
             return False
 
-        fp = _entry_fingerprint(entry)
+        # The live frame supersedes whatever an earlier end event captured;
+        # writes already handed to the background writer land first.
+        self._cancel_pending()
+        _WRITER.flush()
+        # Every queued write has landed; resync in case one of them failed.
+        object.__setattr__(self, "_last_submitted_fp", self._last_saved_fp)
+
         if not force and self._last_saved_fp is not None and fp == self._last_saved_fp:
             return False
 
+        object.__setattr__(self, "_last_submitted_fp", fp)
+        return self._write_entry(_entry_from_fingerprint(fp), fp)
+
+    def _write_entry(self, entry: dict[str, Any], fp: tuple[Any, Any]) -> bool:
         wrote = _upsert_entry(
             path=self.cache_path,
             tag=self.tag,
@@ -426,17 +799,9 @@ class WindowTracker:
         )
         if wrote:
             object.__setattr__(self, "_last_saved_fp", fp)
-            try:
-                if "window_level_floating" in entry and isinstance(
-                    entry["window_level_floating"], bool
-                ):
-                    object.__setattr__(
-                        self,
-                        "_window_level_floating",
-                        entry["window_level_floating"],
-                    )
-            except Exception:
-                pass
+            floating = entry.get("window_level_floating")
+            if isinstance(floating, bool):
+                object.__setattr__(self, "_window_level_floating", floating)
         return wrote
 
     def save_now(self) -> None:
@@ -503,12 +868,10 @@ class WindowTracker:
         if restored is not None:
             _frame, floating = restored
             object.__setattr__(self, "_window_level_floating", floating)
-            entry = _mk_entry_from_manager(
-                mgr,
-                window_level_floating=floating,
-            )
-            if entry is not None:
-                object.__setattr__(self, "_last_saved_fp", _entry_fingerprint(entry))
+            fp = _manager_fingerprint(mgr, window_level_floating=floating)
+            if fp is not None:
+                object.__setattr__(self, "_last_saved_fp", fp)
+                object.__setattr__(self, "_last_submitted_fp", fp)
 
     def set_window_level(self, *, floating: bool) -> None:
         """Set always-on-top behavior (macOS only) and persist it.
@@ -522,6 +885,8 @@ class WindowTracker:
             return
         if not hasattr(mgr, "set_window_level"):
             return
+        # Let queued writes (carrying the previous level) finish first.
+        _WRITER.flush()
         try:
             mgr.set_window_level(bool(floating))
         except Exception:
@@ -558,7 +923,10 @@ def track_position_size(
       machine, the window frame is restored immediately via `set_window_frame`.
     - The function subscribes to `window_move_end_event` and
       `window_resize_end_event`. When either fires, it saves the full window
-      frame to disk (position + size), but only if it changed.
+      frame to disk (position + size), but only if it changed. Bursts of end
+      events are coalesced into one write after a short quiet period, done on
+      a background thread; a save still waiting at interpreter exit is
+      written then.
     - On unsupported backends or Matplotlib builds without the required macOS
       manager APIs, the function is a silent no-op and returns None.
 
@@ -580,14 +948,7 @@ def track_position_size(
     except Exception:
         return None
 
-    required = (
-        "get_window_frame",
-        "set_window_frame",
-        "raise_window",
-        "mpl_connect",
-        "mpl_disconnect",
-    )
-    if not _has_attrs(mgr, required):
+    if not _manager_supported(mgr):
         return None
 
     path = _cache_file_path(cache_dir)
@@ -599,127 +960,183 @@ def track_position_size(
         restored = _restore_from_cache(mgr=mgr, tag=tag, machine_id=mid, path=path)
         if restored is not None:
             _frame, window_level_floating = restored
-            entry = _mk_entry_from_manager(
+            last_saved_fp = _manager_fingerprint(
                 mgr,
                 window_level_floating=window_level_floating,
             )
-            if entry is not None:
-                last_saved_fp = _entry_fingerprint(entry)
 
-    wfig = weakref.ref(fig)
-    wmgr = weakref.ref(mgr)
+    tracker = WindowTracker(
+        tag=tag,
+        cache_path=path,
+        machine_id=mid,
+        _fig_ref=weakref.ref(fig),
+        _mgr_ref=weakref.ref(mgr),
+        _cids=(),
+        _last_saved_fp=last_saved_fp,
+        _window_level_floating=window_level_floating,
+    )
 
-    def _on_end_event(*_args: Any, **_kwargs: Any) -> None:
-        m = wmgr()
-        if m is None:
-            return
-        entry = _mk_entry_from_manager(
-            m,
-            window_level_floating=window_level_floating,
+    # Connect a partial rather than the bound method: Matplotlib's callback
+    # registry only weakly references bound methods, and tracking must continue
+    # after the caller drops the returned handle.
+    on_end_event = functools.partial(WindowTracker._on_end_event, tracker)
+    try:
+        cids = tuple(
+            int(mgr.mpl_connect(event, on_end_event)) for event in _TRACKED_EVENTS
         )
-        if entry is None:
-            return
-        fp = _entry_fingerprint(entry)
-        nonlocal last_saved_fp
-        if last_saved_fp is not None and fp == last_saved_fp:
-            return
+    except Exception:
+        return None
 
-        wrote = _upsert_entry(
-            path=path,
-            tag=tag,
-            machine_id=mid,
-            entry=entry,
-            skip_if_unchanged=True,
-        )
-        if wrote:
-            last_saved_fp = fp
+    object.__setattr__(tracker, "_cids", cids)
+    return tracker
+
+
+def _file_signature(path: Path) -> tuple[int, int, int] | None:
+    """Return (inode, mtime_ns, size) of `path`, or None if it cannot be stat'ed.
+
+    Writers replace the file atomically, so any rewrite changes the inode.
+    """
 
     try:
-        cid_move = mgr.mpl_connect("window_move_end_event", _on_end_event)
-        cid_resize = mgr.mpl_connect("window_resize_end_event", _on_end_event)
+        st = path.stat()
     except Exception:
         return None
+    return (st.st_ino, st.st_mtime_ns, st.st_size)
 
-    return WindowTracker(
-        tag=tag,
-        cache_path=path,
-        machine_id=mid,
-        _fig_ref=wfig,
-        _mgr_ref=wmgr,
-        _cids=(int(cid_move), int(cid_resize)),
-        _last_saved_fp=last_saved_fp,
-        _window_level_floating=window_level_floating,
-    )
+
+def _copy_cache(cache: dict[str, Any]) -> dict[str, Any]:
+    """Return a copy of `cache` that callers may update with `_set_entry`.
+
+    Only the containers `_set_entry`/`_ensure_machine_record` mutate are copied;
+    entry dicts are replaced, never updated in place, so they can be shared.
+    """
+
+    return {
+        "version": cache["version"],
+        "machines": dict(cache["machines"]),
+        "entries": {
+            tag: dict(per_tag) if isinstance(per_tag, dict) else per_tag
+            for tag, per_tag in cache["entries"].items()
+        },
+    }
+
+
+def _remember_snapshot(path: Path, cache: dict[str, Any]) -> None:
+    """Record `cache` as the current content of `path` (best-effort)."""
+
+    sig = _file_signature(path)
+    if sig is None:
+        _SNAPSHOTS.pop(path, None)
+        return
+    try:
+        _SNAPSHOTS[path] = (sig, _copy_cache(cache))
+    except Exception:
+        _SNAPSHOTS.pop(path, None)
 
 
 def _load_cache(path: Path) -> dict[str, Any]:
     """Load and validate cache file.
 
+    Reuses the in-memory snapshot when the file has not changed on disk since
+    this process last read or wrote it.
+
     Never raises; returns an empty cache on any failure.
     """
 
-    data = _read_json(path)
-    return _coerce_cache(data)
+    snap = _SNAPSHOTS.get(path)
+    if snap is not None:
+        sig, cached = snap
+        if sig == _file_signature(path):
+            try:
+                return _copy_cache(cached)
+            except Exception:
+                pass
+
+    cache = _coerce_cache(_read_json(path))
+    _remember_snapshot(path, cache)
+    return cache
 
 
 def _entry_fingerprint(entry: dict[str, Any]) -> tuple[Any, Any]:
     """Return a stable fingerprint used to detect meaningful changes.
 
-    The fingerprint includes only fields that should trigger a disk write.
+    The fingerprint includes only fields that should trigger a disk write. It
+    is a flat, hashable tuple (the frame list is converted to a tuple).
     """
 
+    frame = entry.get("frame")
+    if isinstance(frame, list):
+        frame = tuple(frame)
     return (
-        entry.get("frame"),
+        frame,
         entry.get("window_level_floating"),
     )
 
 
-def _atomic_write_text(path: Path, text: str) -> None:
-    """Atomically write text to path (best-effort).
+def _atomic_write_bytes(path: Path, data: bytes) -> bool:
+    """Atomically write bytes to path (best-effort).
+
+    Implementation writes a per-process temporary file next to `path` with
+    plain `os.open`/`os.write` and uses `os.replace` for an atomic swap on most
+    filesystems.
 
-    Implementation writes a temporary file in the same directory and uses
-    `os.replace` for an atomic swap on most filesystems.
+    Returns True if the file was replaced, False otherwise.
     """
 
     _ensure_parent_dir(path)
 
-    tmp: Path | None = None
+    # Keep the temp file on the same filesystem for atomic replace; the pid
+    # keeps concurrent writers from different processes apart.
+    tmp = path.with_name(f"{path.name}.{os.getpid()}.tmp")
     try:
-        import tempfile
-
-        # Keep the temp file on the same filesystem for atomic replace.
-        with tempfile.NamedTemporaryFile(
-            mode="w",
-            encoding="utf-8",
-            dir=str(path.parent),
-            delete=False,
-        ) as f:
-            tmp = Path(f.name)
-            f.write(text)
-            if not text.endswith("\n"):
-                f.write("\n")
+        fd = os.open(tmp, os.O_WRONLY | os.O_CREAT | os.O_TRUNC | _O_BINARY, 0o666)
+        try:
+            view = memoryview(data)
+            while view:
+                view = view[os.write(fd, view) :]
+        finally:
+            os.close(fd)
 
         os.replace(tmp, path)
+        return True
     except Exception:
         try:
             # Cleanup if we created a temp file but failed to replace.
-            if tmp is not None and tmp.exists():
-                tmp.unlink(missing_ok=True)
+            tmp.unlink(missing_ok=True)
         except Exception:
             pass
+        return False
 
 
-def _write_cache(path: Path, cache: dict[str, Any]) -> None:
-    """Write cache file (atomic, best-effort)."""
+def _write_cache(path: Path, cache: dict[str, Any]) -> bool:
+    """Write cache file (atomic, best-effort).
 
-    try:
-        import json
+    Returns True if the file was written.
+    """
 
-        text = json.dumps(cache, sort_keys=True, indent=2)
-    except Exception:
-        return
+    data: bytes | None = None
+    if _orjson is not None:
+        try:
+            data = _orjson.dumps(
+                cache,
+                option=_orjson.OPT_SORT_KEYS
+                | _orjson.OPT_INDENT_2
+                | _orjson.OPT_APPEND_NEWLINE,
+            )
+        except Exception:
+            data = None
 
-    _atomic_write_text(path, text)
+    if data is None:
+        try:
+            data = (json.dumps(cache, sort_keys=True, indent=2) + "\n").encode("utf-8")
+        except Exception:
+            return False
+
+    if not _atomic_write_bytes(path, data):
+        _SNAPSHOTS.pop(path, None)
+        return False
+    _remember_snapshot(path, cache)
+    return True
 
 
 def _upsert_entry(
@@ -750,22 +1167,44 @@ def _upsert_entry(
     if not isinstance(entry, dict):
         return False
 
+    try:
+        with _WRITE_LOCK:
+            return _upsert_entry_locked(
+                path=path,
+                tag=tag,
+                machine_id=machine_id,
+                entry=entry,
+                skip_if_unchanged=skip_if_unchanged,
+            )
+    except Exception:
+        return False
+
+
+def _upsert_entry_locked(
+    *,
+    path: Path,
+    tag: str,
+    machine_id: str,
+    entry: dict[str, Any],
+    skip_if_unchanged: bool,
+) -> bool:
+    """Body of `_upsert_entry`; the caller holds `_WRITE_LOCK`."""
+
     try:
         cache = _load_cache(path)
         old = _get_entry(cache, tag=tag, machine_id=machine_id)
-        if skip_if_unchanged and old is not None:
-            try:
-                if _entry_fingerprint(old) == _entry_fingerprint(entry):
-                    return False
-            except Exception:
-                pass
+        if (
+            skip_if_unchanged
+            and old is not None
+            and _entry_fingerprint(old) == _entry_fingerprint(entry)
+        ):
+            return False
 
         # Ensure metadata fields.
         entry = dict(entry)
         entry.setdefault("updated_at", _utc_now_iso())
 
         _set_entry(cache, tag=tag, machine_id=machine_id, entry=entry)
-        _write_cache(path, cache)
-        return True
+        return _write_cache(path, cache)
     except Exception:
         return False
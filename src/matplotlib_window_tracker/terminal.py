@@ -1,7 +1,10 @@
 from __future__ import annotations
 
 import contextlib
+import os
+import queue
 import sys
+import threading
 from typing import Any, Callable
 
 from ._helpers import _warn_once
@@ -12,6 +15,30 @@ __all__ = [
 ]
 
 
+# Enter detection shares one stdin reader across calls: a reader blocked in
+# `readline()` cannot be cancelled, so starting one per call would leave
+# threads behind that race each other for the next line.
+_ENTER_LINES: queue.SimpleQueue[str] = queue.SimpleQueue()
+_ENTER_LOCK = threading.Lock()
+_ENTER_READING = False
+
+
+def _read_enter_line() -> None:
+    """Reader thread body: forward one stdin line to `_ENTER_LINES`."""
+
+    global _ENTER_READING
+    try:
+        line: str | None = sys.stdin.readline()
+    except Exception:
+        line = None
+    # Deliver the line and retire this reader in one step, so a concurrent
+    # `_make_enterkey_checker()` either sees the line or starts a new reader.
+    with _ENTER_LOCK:
+        if line is not None:
+            _ENTER_LINES.put(line)
+        _ENTER_READING = False
+
+
 def _make_enterkey_checker() -> tuple[
     contextlib.AbstractContextManager[None], Callable[[], bool], bool
 ]:
@@ -26,32 +53,49 @@ def _make_enterkey_checker() -> tuple[
     - supported: False when stdin/threading is unavailable.
 
     Implementation:
-    - Starts a daemon thread blocked on `sys.stdin.readline()`.
-    - The checker returns `threading.Event.is_set`.
+    - At most one daemon thread per process is blocked on
+      `sys.stdin.readline()`; it hands the line over through a queue and exits.
+      A reader still waiting from an earlier call is reused.
+    - Lines received before this call are discarded.
     """
 
-    import threading
+    global _ENTER_READING
 
-    entered = threading.Event()
+    with _ENTER_LOCK:
+        while True:
+            try:
+                _ENTER_LINES.get_nowait()
+            except queue.Empty:
+                break
+        start = not _ENTER_READING
+        _ENTER_READING = True
 
-    def _wait_for_enter() -> None:
+    if start:
         try:
-            sys.stdin.readline()
-        except Exception:
-            return
-        entered.set()
+            threading.Thread(target=_read_enter_line, daemon=True).start()
+        except Exception as e:
+            with _ENTER_LOCK:
+                _ENTER_READING = False
+            _warn_once(
+                "hold_windows:enter_thread",
+                "matplotlib_window_tracker.hold_windows: Enter trigger unavailable; ignoring keypress",
+                e,
+            )
+            return contextlib.nullcontext(), lambda: False, False
 
-    try:
-        threading.Thread(target=_wait_for_enter, daemon=True).start()
-    except Exception as e:
-        _warn_once(
-            "hold_windows:enter_thread",
-            "matplotlib_window_tracker.hold_windows: Enter trigger unavailable; ignoring keypress",
-            e,
-        )
-        return contextlib.nullcontext(), lambda: False, False
+    entered = False
 
-    return contextlib.nullcontext(), entered.is_set, True
+    def _entered() -> bool:
+        nonlocal entered
+        if not entered:
+            try:
+                _ENTER_LINES.get_nowait()
+            except queue.Empty:
+                return False
+            entered = True
+        return True
+
+    return contextlib.nullcontext(), _entered, True
 
 
 def _make_anykey_checker() -> tuple[
@@ -119,8 +163,14 @@ def _make_anykey_checker() -> tuple[
         )
         return contextlib.nullcontext(), lambda: False, False
 
+    # Set while the terminal is in cbreak mode with VMIN=VTIME=0: a read then
+    # returns immediately, with no data if no key is pending, so each poll is
+    # a single os.read() instead of select() followed by a read.
+    nonblocking_read = False
+
     @contextlib.contextmanager
     def _cbreak() -> Any:
+        nonlocal nonblocking_read
         try:
             old = termios.tcgetattr(fd)
         except Exception:
@@ -128,8 +178,17 @@ def _make_anykey_checker() -> tuple[
 
         try:
             tty.setcbreak(fd)
+            try:
+                attrs = termios.tcgetattr(fd)
+                attrs[6][termios.VMIN] = 0
+                attrs[6][termios.VTIME] = 0
+                termios.tcsetattr(fd, termios.TCSANOW, attrs)
+                nonblocking_read = True
+            except Exception:
+                pass
             yield
         finally:
+            nonblocking_read = False
             if old is not None:
                 try:
                     termios.tcsetattr(fd, termios.TCSADRAIN, old)
@@ -138,6 +197,8 @@ def _make_anykey_checker() -> tuple[
 
     def _pressed() -> bool:
         try:
+            if nonblocking_read:
+                return bool(os.read(fd, 1))
             r, _, _ = select.select([sys.stdin], [], [], 0)
             if r:
                 sys.stdin.read(1)
@@ -1,6 +1,8 @@
 from __future__ import annotations
 
+import os
 from pathlib import Path
+from typing import Any
 
 
 def test_upsert_entry_writes_file(tmp_path: Path) -> None:
@@ -55,3 +57,39 @@ def test_upsert_entry_recovers_from_corrupt_file(tmp_path: Path) -> None:
     assert wrote is True
     c = geometry_cache._load_cache(p)
     assert geometry_cache._get_entry(c, tag="winA", machine_id="m1") is not None
+
+
+def test_load_cache_reuses_snapshot_until_file_changes(
+    monkeypatch: Any, tmp_path: Path
+) -> None:
+    from matplotlib_window_tracker import geometry_cache
+
+    p = tmp_path / "window_geometry.json"
+    entry = {"frame": [1, 2, 3, 4]}
+    assert geometry_cache._upsert_entry(path=p, tag="winA", machine_id="m1", entry=entry)
+
+    reads: list[Path] = []
+    real_read_json = geometry_cache._read_json
+
+    def _counting_read_json(path: Path) -> Any:
+        reads.append(path)
+        return real_read_json(path)
+
+    monkeypatch.setattr(geometry_cache, "_read_json", _counting_read_json)
+
+    # Our own write is remembered: no re-read, and callers get a private copy.
+    c = geometry_cache._load_cache(p)
+    assert reads == []
+    geometry_cache._set_entry(c, tag="winB", machine_id="m1", entry=entry)
+    c = geometry_cache._load_cache(p)
+    assert geometry_cache._get_entry(c, tag="winB", machine_id="m1") is None
+
+    # Another writer replacing the file invalidates the snapshot.
+    other = tmp_path / "other.json"
+    other.write_text(p.read_text(encoding="utf-8").replace("[", "[9, "), encoding="utf-8")
+    os.replace(other, p)
+    c = geometry_cache._load_cache(p)
+    assert reads == [p]
+    e = geometry_cache._get_entry(c, tag="winA", machine_id="m1")
+    assert e is not None
+    assert e["frame"] == [9, 1, 2, 3, 4]
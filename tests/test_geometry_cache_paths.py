@@ -51,3 +51,31 @@ def test_resolve_cache_dir_script_uses_entry_dir(
 
     d = geometry_cache._resolve_cache_dir(None)
     assert d == script_dir / ".matplotlib-window-tracker"
+
+
+def test_resolve_cache_dir_script_survives_deleted_cwd(
+    monkeypatch: Any, tmp_path: Path
+) -> None:
+    import sys
+
+    import pytest
+
+    from matplotlib_window_tracker import geometry_cache
+
+    if sys.platform.startswith("win"):
+        pytest.skip("the working directory cannot be removed on Windows")
+
+    monkeypatch.delenv("MATPLOTLIB_WINDOW_TRACKER_CACHE_DIR", raising=False)
+    monkeypatch.setattr(geometry_cache, "is_interactive", lambda: False)
+
+    script = tmp_path / "run.py"
+    script.write_text("# test\n", encoding="utf-8")
+    monkeypatch.setattr(geometry_cache.sys, "argv", [str(script)])
+
+    gone = tmp_path / "gone"
+    gone.mkdir()
+    monkeypatch.chdir(gone)
+    gone.rmdir()
+
+    d = geometry_cache._resolve_cache_dir(None)
+    assert d == tmp_path / ".matplotlib-window-tracker"
@@ -26,6 +26,17 @@ def test_coerce_cache_rejects_other_versions() -> None:
     assert c == geometry_cache._new_cache()
 
 
+def test_coerce_cache_drops_unknown_keys() -> None:
+    from matplotlib_window_tracker import geometry_cache
+
+    machines = {"m1": {"hostname": "h"}}
+    c = geometry_cache._coerce_cache(
+        {"version": 1, "machines": machines, "entries": {}, "junk": [1, 2]}
+    )
+    assert c == {"version": 1, "machines": machines, "entries": {}}
+    assert c["machines"] is machines
+
+
 def test_set_entry_creates_expected_structure() -> None:
     from matplotlib_window_tracker import geometry_cache
 
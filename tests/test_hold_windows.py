@@ -105,3 +105,138 @@ def test_hold_windows_exits_on_any_key_windows_path(monkeypatch: Any) -> None:
 
     core.hold_windows(poll=0.0, trigger="AnyKey", prompt=None)
     assert called == []
+
+
+def test_hold_windows_resolves_event_pump_once_per_figure(monkeypatch: Any) -> None:
+    _force_agg_backend()
+
+    import matplotlib.pyplot as plt
+
+    from matplotlib_window_tracker import core
+    from matplotlib_window_tracker import terminal
+
+    monkeypatch.setattr(core.sys.stdin, "isatty", lambda: True)
+
+    # Enter is never pressed: the reader returns without signaling.
+    def _no_enter() -> str:
+        raise OSError("no input")
+
+    monkeypatch.setattr(terminal.sys.stdin, "readline", _no_enter)
+
+    class _ImmediateThread:
+        def __init__(self, *, target: Any, daemon: bool) -> None:
+            self._target = target
+
+        def start(self) -> None:
+            self._target()
+
+    monkeypatch.setattr(threading, "Thread", _ImmediateThread)
+
+    # The figure stays open for three ticks, then gets closed.
+    fignums = iter([[1], [1], [1], [1], []])
+    monkeypatch.setattr(plt, "get_fignums", lambda: next(fignums))
+
+    pumped: list[float] = []
+
+    class _Canvas:
+        def start_event_loop(self, dt: float) -> None:
+            pumped.append(dt)
+
+    class _Fig:
+        canvas = _Canvas()
+
+    resolved: list[Any] = []
+
+    def _figure(num: Any) -> _Fig:
+        resolved.append(num)
+        return _Fig()
+
+    monkeypatch.setattr(plt, "figure", _figure)
+
+    core.hold_windows(poll=0.25, prompt=None, trigger="Enter")
+    assert resolved == [1]
+    assert pumped == [0.25, 0.25, 0.25]
+
+
+def test_hold_windows_zero_poll_only_flushes_events(monkeypatch: Any) -> None:
+    _force_agg_backend()
+
+    import matplotlib.pyplot as plt
+
+    from matplotlib_window_tracker import core
+    from matplotlib_window_tracker import terminal
+
+    monkeypatch.setattr(core.sys.stdin, "isatty", lambda: True)
+
+    def _no_enter() -> str:
+        raise OSError("no input")
+
+    monkeypatch.setattr(terminal.sys.stdin, "readline", _no_enter)
+
+    class _ImmediateThread:
+        def __init__(self, *, target: Any, daemon: bool) -> None:
+            self._target = target
+
+        def start(self) -> None:
+            self._target()
+
+    monkeypatch.setattr(threading, "Thread", _ImmediateThread)
+
+    fignums = iter([[1], [1], [1], []])
+    monkeypatch.setattr(plt, "get_fignums", lambda: next(fignums))
+
+    calls: list[str] = []
+
+    class _Canvas:
+        def start_event_loop(self, dt: float) -> None:
+            calls.append("start_event_loop")
+
+        def flush_events(self) -> None:
+            calls.append("flush_events")
+
+    class _Fig:
+        canvas = _Canvas()
+
+    monkeypatch.setattr(plt, "figure", lambda num: _Fig())
+    monkeypatch.setattr(plt, "pause", lambda dt: calls.append("pause"))
+
+    core.hold_windows(poll=0.0, prompt=None, trigger="Enter")
+    assert calls == ["flush_events", "flush_events"]
+
+
+def test_enterkey_checker_shares_one_stdin_reader(monkeypatch: Any) -> None:
+    import queue
+
+    from matplotlib_window_tracker import terminal
+
+    monkeypatch.setattr(terminal, "_ENTER_LINES", queue.SimpleQueue())
+    monkeypatch.setattr(terminal, "_ENTER_READING", False)
+    monkeypatch.setattr(terminal.sys.stdin, "readline", lambda: "\n")
+
+    # Threads are recorded but not run until the test says so.
+    started: list[Any] = []
+
+    class _DeferredThread:
+        def __init__(self, *, target: Any, daemon: bool) -> None:
+            self._target = target
+
+        def start(self) -> None:
+            started.append(self._target)
+
+    monkeypatch.setattr(threading, "Thread", _DeferredThread)
+
+    _, first, supported = terminal._make_enterkey_checker()
+    assert supported is True
+    assert first() is False
+
+    # The reader from the first call is still blocked; it is reused.
+    _, second, _ = terminal._make_enterkey_checker()
+    assert len(started) == 1
+
+    started[0]()
+    assert second() is True
+    assert second() is True
+
+    # Once the reader has delivered its line, a new call starts a new one.
+    terminal._make_enterkey_checker()
+    assert len(started) == 2
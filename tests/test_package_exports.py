@@ -0,0 +1,20 @@
+from __future__ import annotations
+
+
+def test_submodules_are_reachable_as_package_attributes() -> None:
+    import subprocess
+    import sys
+
+    # A fresh interpreter, so no test has imported the submodules already.
+    code = (
+        "import sys, matplotlib_window_tracker as m\n"
+        "assert 'matplotlib_window_tracker.geometry_cache' not in sys.modules\n"
+        "assert m.geometry_cache.track_position_size is m.track_position_size\n"
+        "assert m.core.hold_windows is m.hold_windows\n"
+        "assert m.backends.raise_window is m.raise_window\n"
+        "m.terminal, m.demos, m._helpers\n"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True
+    )
+    assert result.returncode == 0, result.stderr
@@ -30,3 +30,30 @@ def test_raise_window_is_best_effort_on_missing_manager(monkeypatch: Any) -> Non
 
     # Should not raise.
     backends.raise_window(Fig())
+
+
+def test_raise_window_dispatches_on_canvas_module(monkeypatch: Any) -> None:
+    from matplotlib_window_tracker import backends
+
+    raised: list[str] = []
+    monkeypatch.setattr(
+        backends,
+        "_RAISERS",
+        {family: (lambda fig, f=family: raised.append(f)) for family in ("qt", "tk")},
+    )
+
+    TkCanvas = type("FigureCanvasTkAgg", (), {"manager": None})
+    TkCanvas.__module__ = "matplotlib.backends.backend_tkagg"
+    AppCanvas = type("AppCanvas", (TkCanvas,), {})
+    AppCanvas.__module__ = "myapp.widgets"
+    OtherCanvas = type("FigureCanvas", (), {"manager": None})
+    OtherCanvas.__module__ = "mplcairo.qt"
+
+    class Fig:
+        def __init__(self, canvas: Any) -> None:
+            self.canvas = canvas
+
+    backends.raise_window(Fig(TkCanvas()))
+    backends.raise_window(Fig(AppCanvas()))
+    backends.raise_window(Fig(OtherCanvas()))
+    assert raised == ["tk", "tk"]
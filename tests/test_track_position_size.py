@@ -126,3 +126,229 @@ def test_track_position_size_returns_none_when_missing_methods(tmp_path: Path) -
         canvas = C()
 
     assert geometry_cache.track_position_size(BadFig(), tag="x") is None
+
+
+def test_track_position_size_accepts_forwarding_manager(
+    monkeypatch: Any, tmp_path: Path
+) -> None:
+    from matplotlib_window_tracker import geometry_cache
+
+    class ProxyManager:
+        """Forwards every attribute to a wrapped manager."""
+
+        def __init__(self, inner: _FakeManager) -> None:
+            self._inner = inner
+
+        def __getattr__(self, name: str) -> Any:
+            return getattr(self._inner, name)
+
+    inner = _FakeManager()
+    fig = _FakeFig(inner)
+    fig.canvas.manager = ProxyManager(inner)  # type: ignore[assignment]
+
+    p = tmp_path / "window_geometry.json"
+    monkeypatch.setattr(geometry_cache, "_cache_file_path", lambda _cache_dir: p)
+
+    tracker = geometry_cache.track_position_size(fig, tag="winA")
+    assert tracker is not None
+    tracker.disconnect()
+
+
+class _FakeTimer:
+    def __init__(self) -> None:
+        self.callbacks: list[Callable[[], Any]] = []
+        self.running = False
+        self.single_shot = False
+
+    def add_callback(self, cb: Callable[[], Any]) -> None:
+        self.callbacks.append(cb)
+
+    def start(self) -> None:
+        self.running = True
+
+    def stop(self) -> None:
+        self.running = False
+
+    def fire(self) -> None:
+        self.running = False
+        for cb in self.callbacks:
+            cb()
+
+
+class _FakeTimerCanvas(_FakeCanvas):
+    def __init__(self, mgr: _FakeManager) -> None:
+        super().__init__(mgr)
+        self.timers: list[_FakeTimer] = []
+
+    def new_timer(self, interval: int) -> _FakeTimer:
+        t = _FakeTimer()
+        self.timers.append(t)
+        return t
+
+
+def test_track_position_size_debounces_end_events(
+    monkeypatch: Any, tmp_path: Path
+) -> None:
+    from matplotlib_window_tracker import geometry_cache
+
+    mgr = _FakeManager()
+    fig = _FakeFig(mgr)
+    fig.canvas = _FakeTimerCanvas(mgr)
+
+    p = tmp_path / "window_geometry.json"
+    monkeypatch.setattr(geometry_cache, "_cache_file_path", lambda _cache_dir: p)
+    writes: list[dict[str, Any]] = []
+    real_upsert = geometry_cache._upsert_entry
+
+    def _counting_upsert(**kwargs: Any) -> bool:
+        writes.append(kwargs["entry"])
+        return real_upsert(**kwargs)
+
+    monkeypatch.setattr(geometry_cache, "_upsert_entry", _counting_upsert)
+
+    tracker = geometry_cache.track_position_size(fig, tag="winA")
+    assert tracker is not None
+
+    # A burst of end events only (re)starts the timer.
+    mgr.set_window_frame(1, 2, 3, 4)
+    mgr.trigger("window_move_end_event")
+    mgr.set_window_frame(5, 6, 7, 8)
+    mgr.trigger("window_resize_end_event")
+    (timer,) = fig.canvas.timers
+    assert timer.running
+    assert writes == []
+
+    # The timer hands the write to the background writer.
+    timer.fire()
+    geometry_cache._WRITER.flush()
+    assert [w["frame"] for w in writes] == [[5, 6, 7, 8]]
+
+    # A pending save is written when the tracker is disconnected.
+    mgr.set_window_frame(9, 9, 9, 9)
+    mgr.trigger("window_move_end_event")
+    tracker.disconnect()
+    assert [w["frame"] for w in writes] == [[5, 6, 7, 8], [9, 9, 9, 9]]
+    assert not timer.running
+
+
+def test_pending_debounced_save_is_flushed_at_exit(
+    monkeypatch: Any, tmp_path: Path
+) -> None:
+    from matplotlib_window_tracker import geometry_cache
+
+    mgr = _FakeManager()
+    fig = _FakeFig(mgr)
+    fig.canvas = _FakeTimerCanvas(mgr)
+
+    p = tmp_path / "window_geometry.json"
+    monkeypatch.setattr(geometry_cache, "_cache_file_path", lambda _cache_dir: p)
+
+    tracker = geometry_cache.track_position_size(fig, tag="winA")
+    assert tracker is not None
+
+    mgr.set_window_frame(1, 2, 3, 4)
+    mgr.trigger("window_move_end_event")
+    (timer,) = fig.canvas.timers
+    assert timer.running
+    assert not p.exists()
+
+    # The program exits before the debounce timer fires.
+    geometry_cache._flush_pending_saves()
+    assert not timer.running
+    assert not geometry_cache._PENDING_TRACKERS
+
+    cache = geometry_cache._load_cache(p)
+    entry = geometry_cache._get_entry(
+        cache, tag="winA", machine_id=geometry_cache._machine_id()
+    )
+    assert entry is not None
+    assert entry["frame"] == [1, 2, 3, 4]
+
+
+def test_moving_back_while_a_write_is_queued_saves_the_final_frame(
+    monkeypatch: Any, tmp_path: Path
+) -> None:
+    import threading
+
+    from matplotlib_window_tracker import geometry_cache
+
+    mgr = _FakeManager()
+    fig = _FakeFig(mgr)
+    fig.canvas = _FakeTimerCanvas(mgr)
+
+    p = tmp_path / "window_geometry.json"
+    monkeypatch.setattr(geometry_cache, "_cache_file_path", lambda _cache_dir: p)
+
+    # Writes of frame B block in the background writer until released.
+    release = threading.Event()
+    real_upsert = geometry_cache._upsert_entry
+
+    def _slow_upsert(**kwargs: Any) -> bool:
+        if kwargs["entry"]["frame"] == [5, 5, 10, 10]:
+            release.wait(timeout=5)
+        return real_upsert(**kwargs)
+
+    monkeypatch.setattr(geometry_cache, "_upsert_entry", _slow_upsert)
+
+    tracker = geometry_cache.track_position_size(fig, tag="winA")
+    assert tracker is not None
+
+    # Frame A is saved.
+    mgr.set_window_frame(0, 0, 10, 10)
+    mgr.trigger("window_move_end_event")
+    (timer,) = fig.canvas.timers
+    timer.fire()
+    geometry_cache._WRITER.flush()
+
+    # Frame B is handed to the (stalled) writer, then the window moves back.
+    mgr.set_window_frame(5, 5, 10, 10)
+    mgr.trigger("window_move_end_event")
+    timer.fire()
+    mgr.set_window_frame(0, 0, 10, 10)
+    mgr.trigger("window_move_end_event")
+    assert timer.running
+
+    release.set()
+    timer.fire()
+    geometry_cache._WRITER.flush()
+
+    cache = geometry_cache._load_cache(p)
+    entry = geometry_cache._get_entry(
+        cache, tag="winA", machine_id=geometry_cache._machine_id()
+    )
+    assert entry is not None
+    assert entry["frame"] == [0, 0, 10, 10]
+
+
+def test_track_position_size_saves_synchronously_with_inert_timer(
+    monkeypatch: Any, tmp_path: Path
+) -> None:
+    from matplotlib.backend_bases import TimerBase
+
+    from matplotlib_window_tracker import geometry_cache
+
+    class _InertTimerCanvas(_FakeCanvas):
+        # Like Agg: a bare TimerBase that never fires.
+        def new_timer(self, interval: int) -> TimerBase:
+            return TimerBase(interval=interval)
+
+    mgr = _FakeManager()
+    fig = _FakeFig(mgr)
+    fig.canvas = _InertTimerCanvas(mgr)
+
+    p = tmp_path / "window_geometry.json"
+    monkeypatch.setattr(geometry_cache, "_cache_file_path", lambda _cache_dir: p)
+
+    tracker = geometry_cache.track_position_size(fig, tag="winA")
+    assert tracker is not None
+
+    mgr.set_window_frame(1, 2, 3, 4)
+    mgr.trigger("window_move_end_event")
+    assert not geometry_cache._PENDING_TRACKERS
+
+    cache = geometry_cache._load_cache(p)
+    entry = geometry_cache._get_entry(
+        cache, tag="winA", machine_id=geometry_cache._machine_id()
+    )
+    assert entry is not None
+    assert entry["frame"] == [1, 2, 3, 4]